@@ -1,135 +1,224 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 from shiny import App, ui, render, reactive, req
 from shiny.types import FileInfo
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import json
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from pathlib import Path
 from shinywidgets import output_widget, render_widget
 import shinyswatch
 
-# Load data
+# Data file and its cleaned Parquet cache
+DATA_PATH = Path("us_health_states.csv")
+CACHE_PATH = Path("us_health_states.parquet")
+CACHE_META_PATH = Path("us_health_states.parquet.meta")
+# Bump when clean_data() changes so stale caches are rebuilt
+CACHE_VERSION = 8
+
+# First number in a cell, with comma or point as decimal mark
+NUMBER_PATTERN = re.compile(r"(?P<number>[-+]?\d+(?:[.,]\d+)?)")
+
+# Raw CSV indicator columns and their names in the app
+COLUMN_RENAMES = {
+    "Adult obesity [in %]": "Adult.obesity..in...",
+    "Adult smoking [in %]": "Adult.smoking..in...",
+    "Physically Unhealthy Days": "Physical.unhealthy.days",
+    "Mentally Unhealthy Days": "Mental.unhealthy.days"
+}
+# Only these CSV columns are read; the other text columns are never used
+RAW_COLUMNS = ["year", "State", *COLUMN_RENAMES]
+
+# Health indicator columns (after renaming) with chart and card labels
+INDICATOR_LABELS = {
+    "Adult.obesity..in...": "Obesity Rate (%)",
+    "Adult.smoking..in...": "Smoking Rate (%)",
+    "Physical.unhealthy.days": "Physically Unhealthy Days",
+    "Mental.unhealthy.days": "Mentally Unhealthy Days"
+}
+INDICATOR_SHORT = {
+    "Adult.obesity..in...": "Obesity Rate",
+    "Adult.smoking..in...": "Smoking Rate",
+    "Physical.unhealthy.days": "Physically Unhealthy Days",
+    "Mental.unhealthy.days": "Mentally Unhealthy Days"
+}
+INDICATOR_COLS = list(INDICATOR_LABELS)
+
+# Most rows the data table shows (highest values first)
+TABLE_MAX_ROWS = 200
+
+# Define region mapping (states not listed are West)
+REGION_STATES = {
+    "Northeast": ["Connecticut", "Maine", "Massachusetts", "New Hampshire",
+                  "Rhode Island", "Vermont", "New York", "New Jersey", "Pennsylvania"],
+    "Midwest": ["Illinois", "Indiana", "Michigan", "Ohio", "Wisconsin",
+                "Iowa", "Kansas", "Minnesota", "Missouri", "Nebraska",
+                "North Dakota", "South Dakota"],
+    "South": ["Delaware", "Florida", "Georgia", "Maryland", "North Carolina",
+              "South Carolina", "Virginia", "West Virginia", "Alabama",
+              "Kentucky", "Mississippi", "Tennessee", "Arkansas",
+              "Louisiana", "Oklahoma", "Texas"]
+}
+STATE_TO_REGION = {state: region for region, states in REGION_STATES.items() for state in states}
+
+# Load data (cached, so repeated calls in one process never re-parse)
+@lru_cache(maxsize=1)
 def load_data():
-    """Load and preprocess health data"""
-    health_data = pd.read_csv("us_health_states.csv", sep=";")
-    
-    # Rename columns
-    health_data = health_data.rename(columns={
-        "Adult obesity [in %]": "Adult.obesity..in...",
-        "Adult smoking [in %]": "Adult.smoking..in...",
-        "Physically Unhealthy Days": "Physical.unhealthy.days",
-        "Mentally Unhealthy Days": "Mental.unhealthy.days"
-    })
-    
-    # Data cleaning and transformation
-    def clean_numeric_column(col):
-        """Clean numeric columns"""
-        # Convert to string
-        col_str = col.astype(str)
-        # Replace comma with decimal point
-        col_str = col_str.str.replace(",", ".")
-        # Remove non-numeric characters (keep decimal point)
-        col_str = col_str.str.replace(r"[^0-9.]", "", regex=True)
-        # Convert to numeric, errors become NaN
-        return pd.to_numeric(col_str, errors='coerce')
-    
-    # Clean numeric columns
-    health_data["Adult.obesity..in..."] = clean_numeric_column(health_data["Adult.obesity..in..."])
-    health_data["Adult.smoking..in..."] = clean_numeric_column(health_data["Adult.smoking..in..."])
-    health_data["Physical.unhealthy.days"] = clean_numeric_column(health_data["Physical.unhealthy.days"])
-    health_data["Mental.unhealthy.days"] = clean_numeric_column(health_data["Mental.unhealthy.days"])
+    """Load health data, reusing the Parquet cache while the CSV is unchanged"""
+    stat = DATA_PATH.stat()
+    key = [CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+    
+    # Cache hit: the sidecar records the CSV state the cache was built from
+    if CACHE_PATH.exists() and CACHE_META_PATH.exists():
+        try:
+            if json.loads(CACHE_META_PATH.read_text()).get("key") == key:
+                return pd.read_parquet(CACHE_PATH, memory_map=True)
+        except (OSError, ValueError):
+            pass  # Unreadable cache, rebuild below
+    
+    health_data = clean_data()
+    
+    # Cache miss: persist the cleaned frame for the next start
+    try:
+        health_data.to_parquet(CACHE_PATH, compression="zstd")
+        CACHE_META_PATH.write_text(json.dumps({"key": key}))
+    except OSError:
+        pass  # Read-only deployments: skip the cache
     
     return health_data
 
+def clean_data():
+    """Read and preprocess health data from the CSV"""
+    health_data = read_csv_arrow()
+    
+    # Low-cardinality state names as categorical, years as int16
+    health_data["State"] = health_data["State"].astype("category")
+    health_data["year"] = health_data["year"].astype("int16")
+    
+    # Region depends only on State, so store it once as a categorical
+    health_data["Region"] = pd.Categorical(
+        health_data["State"].map(STATE_TO_REGION).fillna("West"),
+        categories=["Northeast", "Midwest", "South", "West"]
+    )
+    
+    # Index by (State, year) so reactive lookups probe the index instead of scanning
+    return health_data.set_index(["State", "year"]).sort_index()
+
+def read_csv_arrow():
+    """Read the CSV with PyArrow and clean indicator columns with Arrow kernels"""
+    # Indicators stay text so the decimal comma can be fixed before casting
+    table = pacsv.read_csv(
+        DATA_PATH,
+        parse_options=pacsv.ParseOptions(delimiter=";"),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=RAW_COLUMNS,
+            column_types={raw: pa.string() for raw in COLUMN_RENAMES}
+        )
+    )
+    
+    # Extract the first number, replace comma with decimal point, cast to float32
+    for raw, col in COLUMN_RENAMES.items():
+        number = pc.struct_field(pc.extract_regex(table[raw], NUMBER_PATTERN.pattern), [0])
+        values = pc.cast(pc.replace_substring(number, ",", "."), pa.float32())
+        table = table.set_column(table.schema.get_field_index(raw), col, values)
+    
+    return table.to_pandas()
+
 # Load data
 health_data = load_data()
 
-# Define region mapping
-def get_region(state):
-    """Return region based on state name"""
-    northeast = ["Connecticut", "Maine", "Massachusetts", "New Hampshire",
-                "Rhode Island", "Vermont", "New York", "New Jersey", "Pennsylvania"]
-    midwest = ["Illinois", "Indiana", "Michigan", "Ohio", "Wisconsin",
-              "Iowa", "Kansas", "Minnesota", "Missouri", "Nebraska",
-              "North Dakota", "South Dakota"]
-    south = ["Delaware", "Florida", "Georgia", "Maryland", "North Carolina",
-            "South Carolina", "Virginia", "West Virginia", "Alabama",
-            "Kentucky", "Mississippi", "Tennessee", "Arkansas",
-            "Louisiana", "Oklahoma", "Texas"]
-    
-    if state in northeast:
-        return "Northeast"
-    elif state in midwest:
-        return "Midwest"
-    elif state in south:
-        return "South"
-    else:
-        return "West"
+# Rank of every state within each year, per indicator (1 = highest value)
+RANKS = {
+    col: health_data[col].dropna().groupby(level="year").rank(ascending=False, method="min").astype("int16")
+    for col in INDICATOR_COLS
+}
 
-# Tutorial content function
-def create_tutorial_content():
-    """Create tutorial content for modal dialog"""
-    return ui.div(
-        {"class": "tutorial-content"},
-        ui.navset_card_tab(
-            ui.nav_panel(
-                "Step 1",
-                ui.div(
-                    ui.h4("Getting Started"),
-                    ui.p("Select the states and year you're interested in exploring:"),
-                    ui.tags.ul(
-                        ui.tags.li("Use the search box to quickly find specific states"),
-                        ui.tags.li("Select multiple states for comparison"),
-                        ui.tags.li("Use the 'Select All States' button to quickly select or deselect all states"),
-                        ui.tags.li("Choose a year from the dropdown to view data for that time period")
-                    )
-                )
-            ),
-            ui.nav_panel(
-                "Step 2", 
-                ui.div(
-                    ui.h4("Choose Health Indicators"),
-                    ui.p("Select a health metric to visualize:"),
-                    ui.tags.ul(
-                        ui.tags.li("Obesity Rate - Shows the percentage of adults with obesity"),
-                        ui.tags.li("Smoking Rate - Shows the percentage of adults who smoke"),
-                        ui.tags.li("Physically Unhealthy Days - Average days of poor physical health"),
-                        ui.tags.li("Mentally Unhealthy Days - Average days of poor mental health")
-                    ),
-                    ui.p("The selected indicator will be displayed in all visualizations and the data table.")
-                )
+# Trend series per indicator and state as year-sorted (years, values) arrays,
+# contiguous int16/float32 so Plotly serializes them without per-point conversion
+TREND_ARRAYS = {
+    col: {
+        state: (
+            np.ascontiguousarray(group.index.get_level_values("year"), dtype=np.int16),
+            np.ascontiguousarray(group.to_numpy(), dtype=np.float32)
+        )
+        for state, group in health_data[col].dropna().groupby(level="State", observed=True)
+    }
+    for col in INDICATOR_COLS
+}
+
+# Sorted state names, plus (lowercase, name) pairs sorted for prefix search
+ALL_STATES_SORTED = tuple(sorted(health_data.index.unique(level="State").tolist()))
+STATES_LOWER_SORTED = sorted((state.lower(), state) for state in ALL_STATES_SORTED)
+
+# Selectize choices, built once
+STATE_CHOICES = {state: state for state in ALL_STATES_SORTED}
+YEAR_CHOICES = {str(year): str(year) for year in health_data.index.unique(level="year").sort_values()}
+LATEST_YEAR = list(YEAR_CHOICES)[-1]
+
+# Tutorial steps shown in the modal dialog (built once, reused on every click)
+_TUTORIAL_TABS = ui.navset_card_tab(
+    ui.nav_panel(
+        "Step 1",
+        ui.div(
+            ui.h4("Getting Started"),
+            ui.p("Select the states and year you're interested in exploring:"),
+            ui.tags.ul(
+                ui.tags.li("Use the search box to quickly find specific states"),
+                ui.tags.li("Select multiple states for comparison"),
+                ui.tags.li("Use the 'Select All States' button to quickly select or deselect all states"),
+                ui.tags.li("Choose a year from the dropdown to view data for that time period")
+            )
+        )
+    ),
+    ui.nav_panel(
+        "Step 2", 
+        ui.div(
+            ui.h4("Choose Health Indicators"),
+            ui.p("Select a health metric to visualize:"),
+            ui.tags.ul(
+                ui.tags.li("Obesity Rate - Shows the percentage of adults with obesity"),
+                ui.tags.li("Smoking Rate - Shows the percentage of adults who smoke"),
+                ui.tags.li("Physically Unhealthy Days - Average days of poor physical health"),
+                ui.tags.li("Mentally Unhealthy Days - Average days of poor mental health")
             ),
-            ui.nav_panel(
-                "Step 3",
-                ui.div(
-                    ui.h4("Exploring Visualizations"),
-                    ui.p("Analyze data using different visualization types:"),
-                    ui.tags.ul(
-                        ui.tags.li("Bar Chart: Compare values across states for the selected year"),
-                        ui.tags.li("Trend Line Chart: View how indicators change over time for each state"),
-                        ui.tags.li("Data Table: Explore detailed data with options to customize columns")
-                    ),
-                    ui.p("Hover over charts for more details, or expand them to full screen using the icon in the top-right corner.")
-                )
+            ui.p("The selected indicator will be displayed in all visualizations and the data table.")
+        )
+    ),
+    ui.nav_panel(
+        "Step 3",
+        ui.div(
+            ui.h4("Exploring Visualizations"),
+            ui.p("Analyze data using different visualization types:"),
+            ui.tags.ul(
+                ui.tags.li("Bar Chart: Compare values across states for the selected year"),
+                ui.tags.li("Trend Line Chart: View how indicators change over time for each state"),
+                ui.tags.li("Data Table: Explore detailed data with options to customize columns")
             ),
-            ui.nav_panel(
-                "Step 4",
-                ui.div(
-                    ui.h4("Accessibility Features"),
-                    ui.p("Customize the interface to suit your needs:"),
-                    ui.tags.ul(
-                        ui.tags.li("Dark Mode: Toggle between light and dark themes"),
-                        ui.tags.li("Theme Picker: Choose from various theme options"),
-                        ui.tags.li("Zoom Control: Adjust the interface size for better visibility"),
-                        ui.tags.li("Keyboard Navigation: Use Tab, arrow keys, and Enter to navigate without a mouse")
-                    ),
-                    ui.p("All visualizations are accessible with keyboard navigation and screen readers.")
-                )
+            ui.p("Hover over charts for more details, or expand them to full screen using the icon in the top-right corner.")
+        )
+    ),
+    ui.nav_panel(
+        "Step 4",
+        ui.div(
+            ui.h4("Accessibility Features"),
+            ui.p("Customize the interface to suit your needs:"),
+            ui.tags.ul(
+                ui.tags.li("Dark Mode: Toggle between light and dark themes"),
+                ui.tags.li("Theme Picker: Choose from various theme options"),
+                ui.tags.li("Zoom Control: Adjust the interface size for better visibility"),
+                ui.tags.li("Keyboard Navigation: Use Tab, arrow keys, and Enter to navigate without a mouse")
             ),
-            id="tutorial_tabs"
+            ui.p("All visualizations are accessible with keyboard navigation and screen readers.")
         )
-    )
+    ),
+    id="tutorial_tabs"
+)
 
 # UI definition
 app_ui = ui.page_fluid(
@@ -139,20 +228,23 @@ app_ui = ui.page_fluid(
         $(document).ready(function() {
             // Initialize zoom
             let currentZoom = 100;
+            let zoomTimer = null;
             
-            // Function to apply zoom
+            // Function to apply zoom (CSS zoom, no body size recomputation)
             function applyZoom(zoomLevel) {
-                const zoomValue = zoomLevel / 100;
-                document.body.style.transform = `scale(${zoomValue})`;
-                document.body.style.transformOrigin = 'top left';
-                document.body.style.width = `${100 / zoomValue}%`;
-                document.body.style.height = `${100 / zoomValue}%`;
+                currentZoom = zoomLevel;
+                document.documentElement.style.zoom = zoomLevel + '%';
             }
             
             // Listen for zoom slider changes
             $(document).on('input', '#zoom_slider', function() {
                 const zoomLevel = parseInt($(this).val());
-                applyZoom(zoomLevel);
+                
+                // Coalesce rapid slider drags into one zoom after 50ms
+                clearTimeout(zoomTimer);
+                zoomTimer = setTimeout(function() {
+                    applyZoom(zoomLevel);
+                }, 50);
                 
                 // Update zoom display
                 $('#zoom_display').text(zoomLevel + '%');
@@ -219,7 +311,7 @@ app_ui = ui.page_fluid(
             ui.input_selectize(
                 "state", 
                 "Select States:",
-                choices={state: state for state in sorted(health_data['State'].unique())},
+                choices=STATE_CHOICES,
                 selected=["Alabama"],
                 multiple=True
             ),
@@ -230,8 +322,8 @@ app_ui = ui.page_fluid(
             ui.input_selectize(
                 "year",
                 "Select Year:",
-                choices={str(year): str(year) for year in sorted(health_data['year'].unique())},
-                selected=str(health_data['year'].max())
+                choices=YEAR_CHOICES,
+                selected=LATEST_YEAR
             ),
             
             ui.hr(),
@@ -240,12 +332,7 @@ app_ui = ui.page_fluid(
             ui.input_selectize(
                 "primary_var",
                 "Select Health Indicator:",
-                choices={
-                    "Adult.obesity..in...": "Obesity Rate",
-                    "Adult.smoking..in...": "Smoking Rate",
-                    "Physical.unhealthy.days": "Physically Unhealthy Days",
-                    "Mental.unhealthy.days": "Mentally Unhealthy Days"
-                },
+                choices=INDICATOR_SHORT,
                 selected="Adult.obesity..in..."
             )
         ),
@@ -318,13 +405,180 @@ app_ui = ui.page_fluid(
                             inline=True
                         )
                     ),
-                    ui.output_data_frame("data_table")
+                    ui.output_data_frame("data_table"),
+                    ui.p(
+                        f"Showing up to {TABLE_MAX_ROWS} rows, highest values first.",
+                        {"class": "text-muted small mt-2"}
+                    )
                 )
             )
         )
     )
 )
 
+# Above this many bars the bar chart drops its per-bar colorscale
+BAR_COLORSCALE_MAX = 30
+
+# Above this many points in total the trend chart is downsampled
+TREND_MAX_POINTS = 2000
+
+def downsample_lttb(x, y, n_out):
+    """Reduce one series to n_out points, keeping its visual shape (LTTB)"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    xf = x.astype(np.float64)
+    yf = y.astype(np.float64)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    
+    # First and last points are kept; the rest is split into n_out - 2 buckets
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        
+        # Average of the next bucket (or the last point) as the third vertex
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = xf[end:next_end].mean() if next_end > end else xf[-1]
+        avg_y = yf[end:next_end].mean() if next_end > end else yf[-1]
+        
+        # Keep the point forming the largest triangle with a and the average
+        areas = np.abs(
+            (xf[a] - avg_x) * (yf[start:end] - yf[a])
+            - (xf[a] - xf[start:end]) * (avg_y - yf[a])
+        )
+        a = start + int(areas.argmax())
+        keep[i + 1] = a
+    
+    return x[keep], y[keep]
+
+# Cached computations, keyed on (sorted states, year, indicator) and shared
+# by all sessions. Results are shared objects, so callers must not mutate them.
+@lru_cache(maxsize=256)
+def compute_current(states, year, var, extras=()):
+    """Selected states' values for one year, plus any of Region/Rank in extras"""
+    # Project the needed columns in the lookup itself; the result is a new frame
+    columns = [var, 'Region'] if 'Region' in extras else [var]
+    # Only request (state, year) rows that exist: a MultiIndex .loc raises
+    # KeyError on missing labels, where an empty frame is wanted instead
+    rows = [(state, year) for state in states if (state, year) in health_data.index]
+    data = (
+        health_data.loc[rows, columns]
+        .rename(columns={var: 'value'})
+        .dropna(subset=['value'])
+    )
+    
+    # Add ranking (precomputed across all states) only when it is shown
+    if 'Rank' in extras:
+        data['Rank'] = RANKS[var].reindex(data.index).to_numpy()
+    
+    # Name the index levels directly instead of renaming columns afterwards
+    return data.rename_axis(['State', 'Year']).reset_index()
+
+@lru_cache(maxsize=256)
+def compute_trend(states, var):
+    """Prebuilt (years, values) arrays for each selected state with data"""
+    series = TREND_ARRAYS[var]
+    data = {state: series[state] for state in states if state in series}
+    
+    # Bound the payload sent to the browser however large the data grows
+    total = sum(len(years) for years, _ in data.values())
+    if total > TREND_MAX_POINTS:
+        n_out = max(3, TREND_MAX_POINTS // len(data))
+        data = {
+            state: downsample_lttb(years, values, n_out)
+            for state, (years, values) in data.items()
+        }
+    
+    return data
+
+@lru_cache(maxsize=256)
+def build_bar_fig(states, year, var):
+    """Horizontal bar chart comparing the selected states in one year"""
+    data = compute_current(states, year, var)
+    if data.empty:
+        return None
+    
+    # Get indicator name
+    y_label = INDICATOR_LABELS.get(var, "Value")
+    
+    # Sort plain (state, value) arrays once, smallest value first
+    values = data['value'].to_numpy()
+    order = values.argsort(kind='stable')
+    values = values[order]
+    state_names = data['State'].astype(str).to_numpy()[order]
+    
+    # Value-scaled colors for small selections, one flat color for many bars
+    if len(values) > BAR_COLORSCALE_MAX:
+        marker = dict(color="#4292c6")
+    else:
+        marker = dict(
+            color=values,
+            colorscale='Blues',
+            showscale=True,
+            colorbar=dict(title=y_label)
+        )
+    
+    # Create bar chart
+    fig = go.Figure(go.Bar(
+        x=values,
+        y=state_names,
+        orientation='h',
+        marker=marker
+    ))
+    
+    fig.update_layout(
+        title=f"{y_label} Comparison - {year}",
+        xaxis_title=y_label,
+        yaxis_title='State',
+        uirevision=str(year),
+        height=500,
+        font=dict(size=12),
+        title_font_size=16,
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+    
+    return fig
+
+@lru_cache(maxsize=256)
+def build_trend_fig(states, var):
+    """Line chart of the selected states over all years"""
+    data = compute_trend(states, var)
+    if not data:
+        return None
+    
+    # Get indicator name
+    y_label = INDICATOR_LABELS.get(var, "Value")
+    
+    # Create trend chart with one WebGL trace per state
+    fig = go.Figure([
+        go.Scattergl(
+            x=years,
+            y=values,
+            name=state,
+            mode='lines+markers'
+        )
+        for state, (years, values) in data.items()
+    ])
+    
+    fig.update_layout(
+        title=f"{y_label} Trends Over Time",
+        xaxis_title='Year',
+        yaxis_title=y_label,
+        legend_title_text='State',
+        uirevision=var,
+        height=500,
+        font=dict(size=12),
+        title_font_size=16,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+    
+    return fig
+
 # Server logic
 def server(input, output, session):
     # Initialize theme picker
@@ -343,63 +597,7 @@ def server(input, output, session):
         modal_content = ui.modal(
             ui.div(
                 {"class": "tutorial-content"},
-                ui.navset_card_tab(
-                    ui.nav_panel(
-                        "Step 1",
-                        ui.div(
-                            ui.h4("Getting Started"),
-                            ui.p("Select the states and year you're interested in exploring:"),
-                            ui.tags.ul(
-                                ui.tags.li("Use the search box to quickly find specific states"),
-                                ui.tags.li("Select multiple states for comparison"),
-                                ui.tags.li("Use the 'Select All States' button to quickly select or deselect all states"),
-                                ui.tags.li("Choose a year from the dropdown to view data for that time period")
-                            )
-                        )
-                    ),
-                    ui.nav_panel(
-                        "Step 2", 
-                        ui.div(
-                            ui.h4("Choose Health Indicators"),
-                            ui.p("Select a health metric to visualize:"),
-                            ui.tags.ul(
-                                ui.tags.li("Obesity Rate - Shows the percentage of adults with obesity"),
-                                ui.tags.li("Smoking Rate - Shows the percentage of adults who smoke"),
-                                ui.tags.li("Physically Unhealthy Days - Average days of poor physical health"),
-                                ui.tags.li("Mentally Unhealthy Days - Average days of poor mental health")
-                            ),
-                            ui.p("The selected indicator will be displayed in all visualizations and the data table.")
-                        )
-                    ),
-                    ui.nav_panel(
-                        "Step 3",
-                        ui.div(
-                            ui.h4("Exploring Visualizations"),
-                            ui.p("Analyze data using different visualization types:"),
-                            ui.tags.ul(
-                                ui.tags.li("Bar Chart: Compare values across states for the selected year"),
-                                ui.tags.li("Trend Line Chart: View how indicators change over time for each state"),
-                                ui.tags.li("Data Table: Explore detailed data with options to customize columns")
-                            ),
-                            ui.p("Hover over charts for more details, or expand them to full screen using the icon in the top-right corner.")
-                        )
-                    ),
-                    ui.nav_panel(
-                        "Step 4",
-                        ui.div(
-                            ui.h4("Accessibility Features"),
-                            ui.p("Customize the interface to suit your needs:"),
-                            ui.tags.ul(
-                                ui.tags.li("Dark Mode: Toggle between light and dark themes"),
-                                ui.tags.li("Theme Picker: Choose from various theme options"),
-                                ui.tags.li("Zoom Control: Adjust the interface size for better visibility"),
-                                ui.tags.li("Keyboard Navigation: Use Tab, arrow keys, and Enter to navigate without a mouse")
-                            ),
-                            ui.p("All visualizations are accessible with keyboard navigation and screen readers.")
-                        )
-                    ),
-                    id="tutorial_tabs"
-                )
+                _TUTORIAL_TABS
             ),
             title="Tutorial - Health Data Dashboard",
             size="l",
@@ -465,31 +663,30 @@ def server(input, output, session):
     def close_tutorial():
         ui.modal_remove()
     
-    # Handle zoom changes
-    @reactive.effect
-    def handle_zoom():
-        # The zoom functionality is handled by JavaScript
-        # This reactive effect ensures the server stays responsive to zoom changes
-        if input.zoom_slider():
-            pass  # JavaScript handles the actual zoom implementation
-    
-    # Filtered states list
+    # Filtered states list. Keystrokes are already coalesced client-side:
+    # Shiny's text input binding debounces state_search by 250ms.
     @reactive.calc
     def filtered_states():
         search_term = input.state_search().lower() if input.state_search() else ""
-        all_states = sorted(health_data['State'].unique())
         
         if search_term:
-            # Filter states containing search term
-            filtered = [state for state in all_states if search_term in state.lower()]
-            return filtered if filtered else all_states
-        return all_states
+            # States starting with the search term, found by binary search
+            lo = bisect_left(STATES_LOWER_SORTED, (search_term,))
+            hi = bisect_right(STATES_LOWER_SORTED, (search_term + "\uffff",))
+            filtered = tuple(state for _, state in STATES_LOWER_SORTED[lo:hi])
+            if not filtered:
+                # Fall back to states containing the search term
+                filtered = tuple(state for state_lower, state in STATES_LOWER_SORTED
+                                 if search_term in state_lower)
+            return filtered if filtered else ALL_STATES_SORTED
+        # The shared immutable tuple, no per-keystroke copy
+        return ALL_STATES_SORTED
     
     # Select all states functionality
     @reactive.effect
     @reactive.event(input.select_all_states)
     def select_all_states():
-        all_states = list(health_data['State'].unique())
+        all_states = list(ALL_STATES_SORTED)
         current_selected = input.state() if input.state() else []
         
         if len(current_selected) == len(all_states):
@@ -504,34 +701,12 @@ def server(input, output, session):
     def current_data():
         req(input.state, input.year, input.primary_var)
         
-        data = health_data[
-            (health_data['State'].isin(input.state())) &
-            (health_data['year'] == int(input.year()))
-        ][['State', 'year', input.primary_var()]].copy()
-        
-        data = data.rename(columns={input.primary_var(): 'value'})
-        data = data.dropna(subset=['value'])
-        
-        # Add region and ranking
-        data['Region'] = data['State'].apply(get_region)
-        data['Rank'] = data['value'].rank(ascending=False, method='min').astype(int)
-        data = data.rename(columns={'year': 'Year'})
-        
-        return data
-    
-    # Get trend data
-    @reactive.calc
-    def trend_data():
-        req(input.state, input.primary_var)
-        
-        data = health_data[
-            health_data['State'].isin(input.state())
-        ][['State', 'year', input.primary_var()]].copy()
-        
-        data = data.rename(columns={input.primary_var(): 'value'})
-        data = data.dropna(subset=['value'])
-        
-        return data
+        # Region and Rank are only looked up when the table displays them
+        table_columns = input.table_columns() or ()
+        extras = tuple(col for col in ("Region", "Rank") if col in table_columns)
+        return compute_current(
+            tuple(sorted(input.state())), int(input.year()), input.primary_var(), extras
+        )
     
     # Status box outputs
     @render.text
@@ -548,87 +723,29 @@ def server(input, output, session):
         if not input.primary_var():
             return "Not selected"
         
-        indicator_names = {
-            "Adult.obesity..in...": "Obesity Rate",
-            "Adult.smoking..in...": "Smoking Rate", 
-            "Physical.unhealthy.days": "Physically Unhealthy Days",
-            "Mental.unhealthy.days": "Mentally Unhealthy Days"
-        }
-        return indicator_names.get(input.primary_var(), "Unknown Indicator")
+        return INDICATOR_SHORT.get(input.primary_var(), "Unknown Indicator")
+    
+    # Bar chart figure, memoized until states, year or indicator change
+    @reactive.calc
+    def _bar_fig():
+        req(input.state, input.year, input.primary_var)
+        return build_bar_fig(tuple(sorted(input.state())), int(input.year()), input.primary_var())
     
     # Bar chart
     @render_widget
     def bar_plot():
-        data = current_data()
-        if data.empty:
-            return None
-        
-        # Get indicator name
-        indicator_names = {
-            "Adult.obesity..in...": "Obesity Rate (%)",
-            "Adult.smoking..in...": "Smoking Rate (%)",
-            "Physical.unhealthy.days": "Physically Unhealthy Days",
-            "Mental.unhealthy.days": "Mentally Unhealthy Days"
-        }
-        y_label = indicator_names.get(input.primary_var(), "Value")
-        
-        # Create bar chart
-        fig = px.bar(
-            data.sort_values('value', ascending=True),
-            x='value',
-            y='State',
-            orientation='h',
-            title=f"{y_label} Comparison - {input.year()}",
-            labels={'value': y_label, 'State': 'State'},
-            color='value',
-            color_continuous_scale='Blues'
-        )
-        
-        fig.update_layout(
-            height=500,
-            font=dict(size=12),
-            title_font_size=16,
-            margin=dict(l=20, r=20, t=40, b=20)
-        )
-        
-        return fig
+        return _bar_fig()
+    
+    # Trend chart figure, memoized until states or indicator change
+    @reactive.calc
+    def _trend_fig():
+        req(input.state, input.primary_var)
+        return build_trend_fig(tuple(sorted(input.state())), input.primary_var())
     
     # Trend chart
     @render_widget
     def trend_plot():
-        data = trend_data()
-        if data.empty:
-            return None
-        
-        # Get indicator name
-        indicator_names = {
-            "Adult.obesity..in...": "Obesity Rate (%)",
-            "Adult.smoking..in...": "Smoking Rate (%)", 
-            "Physical.unhealthy.days": "Physically Unhealthy Days",
-            "Mental.unhealthy.days": "Mentally Unhealthy Days"
-        }
-        y_label = indicator_names.get(input.primary_var(), "Value")
-        
-        # Create trend chart
-        fig = px.line(
-            data,
-            x='year',
-            y='value',
-            color='State',
-            title=f"{y_label} Trends Over Time",
-            labels={'year': 'Year', 'value': y_label, 'State': 'State'},
-            markers=True
-        )
-        
-        fig.update_layout(
-            height=500,
-            font=dict(size=12),
-            title_font_size=16,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            margin=dict(l=20, r=20, t=40, b=20)
-        )
-        
-        return fig
+        return _trend_fig()
     
     # Data table
     @render.data_frame
@@ -649,9 +766,12 @@ def server(input, output, session):
             "Rank": "Rank"
         }
         
-        display_data = data[[col_mapping[col] for col in selected_cols if col in col_mapping]].copy()
+        # Partial selection of the top rows instead of a full sort; done before
+        # the projection so the cap and ordering hold even when Value is hidden
+        data = data.nlargest(TABLE_MAX_ROWS, "value")
+        display_data = data[[col_mapping[col] for col in selected_cols if col in col_mapping]]
         
-        # Keep column names in English
+        # Keep column names in English (rename returns a new frame, no .copy() needed)
         rename_mapping = {
             "State": "State",
             "Year": "Year",
@@ -659,21 +779,14 @@ def server(input, output, session):
             "Region": "Region",
             "Rank": "Rank"
         }
-        
-        final_cols = []
-        for col in selected_cols:
-            if col in col_mapping:
-                original_col = col_mapping[col]
-                if original_col in display_data.columns:
-                    final_cols.append(rename_mapping.get(original_col, original_col))
-        
-        display_data.columns = final_cols
+        display_data = display_data.rename(columns=rename_mapping)
         
         # Format numeric columns
         if "Value" in display_data.columns:
-            display_data["Value"] = display_data["Value"].round(2)
+            display_data = display_data.assign(Value=display_data["Value"].astype(float).round(2))
         
-        return display_data.sort_values("Value", ascending=False) if "Value" in display_data.columns else display_data
+        # Fixed-height grid; the browser only renders the visible rows
+        return render.DataGrid(display_data, summary=False, height="500px")
 
 # Create application
 app = App(app_ui, server)